@@ -1,7 +1,13 @@
 import streamlit as st
 import pandas as pd
-from utils import process_leads # importing the function to process leads
+from utils import process_leads, describe_flags, get_flag_mask, FLAG_LABELS # importing the functions to process leads
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import hashlib
+import inspect
+import io
 import os
+import time
 
 # --- Page Configuration ---
 # `set_page_config` must be the first Streamlit command to run.
@@ -11,11 +17,95 @@ st.set_page_config(
     layout="wide" # Using wide layout for data tables
 )
 
+# --- Functions to Load & Process Leads (cached across reruns) ---
+# Scored uploads are also kept on disk as Parquet, so repeat uploads skip CSV parsing and scoring
+PROCESSED_CACHE_DIR = os.path.join('.cache', 'processed_leads')
+# Uploads may contain personal data, so retention is bounded: newest files only, and never older than a week
+PROCESSED_CACHE_MAX_FILES = 16
+PROCESSED_CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+# Fingerprint of the scoring code; editing utils.py invalidates the on-disk cache
+with open(inspect.getfile(process_leads), 'rb') as scoring_source:
+    SCORING_FINGERPRINT = hashlib.sha256(scoring_source.read()).digest()
+
+@st.cache_data(show_spinner=False, max_entries=4) # Keyed on file content, so scoring runs once per upload
+def process_uploaded_file(file_bytes):
+    """Read and score an uploaded CSV given its raw bytes, reusing the on-disk Parquet cache when possible."""
+    cache_key = hashlib.sha256(SCORING_FINGERPRINT + file_bytes).hexdigest()
+    cache_path = os.path.join(PROCESSED_CACHE_DIR, f"{cache_key}.parquet")
+    if os.path.exists(cache_path):
+        try:
+            df_cached = pd.read_parquet(cache_path)
+            if 'score_min' in df_cached.attrs: # attrs only survive Parquet on pandas >= 2.1
+                os.utime(cache_path) # Mark as recently used so pruning keeps it
+                return df_cached
+        except Exception:
+            pass # Unreadable cache file; re-score below and overwrite it
+
+    df_processed = process_leads(pd.read_csv(io.BytesIO(file_bytes), dtype_backend='pyarrow'))
+
+    # Write to a temporary file first so other sessions never read a partial file
+    try:
+        os.makedirs(PROCESSED_CACHE_DIR, exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        df_processed.to_parquet(temp_path, compression='zstd')
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass # Disk cache is best-effort (e.g. read-only filesystem)
+
+    prune_processed_cache()
+    return df_processed
+
+def prune_processed_cache():
+    """Delete cached Parquet files past the age limit, then the least recently used beyond the file limit."""
+    try:
+        cached_files = [(entry.stat().st_mtime, entry.path) for entry in os.scandir(PROCESSED_CACHE_DIR) if entry.is_file()]
+    except OSError:
+        return # Missing directory, or a file removed concurrently; prune on the next upload
+
+    cached_files.sort(reverse=True) # Newest first
+    expiry_time = time.time() - PROCESSED_CACHE_MAX_AGE_SECONDS
+    for index, (modified_time, path) in enumerate(cached_files):
+        if index >= PROCESSED_CACHE_MAX_FILES or modified_time < expiry_time:
+            try:
+                os.remove(path)
+            except OSError:
+                pass # Already removed by another session
+
+@st.cache_resource(show_spinner=False) # Parsed once per process and shared across sessions; treat as read-only
+def load_demo_file(file_path, modified_time):
+    """Read the demo CSV from disk (modification time in the key invalidates it when the file changes)."""
+    return pd.read_csv(file_path, dtype_backend='pyarrow')
+
+@st.cache_data(show_spinner=False)
+def process_demo_file(file_path, modified_time):
+    """Score the demo CSV; process_leads does not modify the shared input frame."""
+    return process_leads(load_demo_file(file_path, modified_time))
+
+# --- Function to Filter Leads (cached per filter combination) ---
+@st.cache_data(show_spinner=False, max_entries=32)
+def filter_leads(_df, data_key, score_range, industries, flag_mask):
+    """
+    Apply sidebar filters to the processed leads.
+    The DataFrame itself is not hashed (leading underscore); `data_key` identifies it instead.
+    """
+    mask = (_df['Score'] >= score_range[0]) & (_df['Score'] <= score_range[1])
+
+    if industries: # If user selects industries
+        mask &= _df['Industry'].isin(industries)
+
+    if flag_mask: # If user selects flags, keep leads having all of them
+        mask &= (_df['Flags'] & flag_mask) == flag_mask
+
+    return _df[mask]
+
 # --- Function to Convert to CSV (for Download Button) ---
 @st.cache_data # Cache data to avoid re-conversion on every render
 def convert_df_to_csv(df):
-    """Convert DataFrame to CSV (UTF-8) format for download."""
-    return df.to_csv(index=False).encode('utf-8')
+    """Convert DataFrame to CSV (UTF-8) format for download, using Arrow's multi-threaded C++ writer."""
+    buffer = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buffer)
+    return buffer.getvalue()
 
 # --- App Title and Description ---
 st.title("Lead Prioritization Tool")
@@ -34,11 +124,14 @@ uploaded_file = st.sidebar.file_uploader(
 )
 
 # --- Main Logic: Load and Process Data ---
-df_raw = None
+df_processed = None
+data_key = None # Cheap identifier of the loaded data, used as filter cache key
 if uploaded_file is not None:
     # If user uploads a file, use that file
     try:
-        df_raw = pd.read_csv(uploaded_file)
+        # Process DataFrame using functions from utils.py (cached per file content)
+        df_processed = process_uploaded_file(uploaded_file.getvalue())
+        data_key = uploaded_file.file_id
         st.sidebar.success("File successfully uploaded!")
     except Exception as e:
         st.sidebar.error(f"Error reading file: {e}")
@@ -46,21 +139,20 @@ else:
     # If no file is uploaded, use demo data
     demo_file_path = os.path.join('data', 'saasquatch_leads_dummy.csv')
     if os.path.exists(demo_file_path):
-        df_raw = pd.read_csv(demo_file_path)
+        demo_modified_time = os.path.getmtime(demo_file_path)
+        df_processed = process_demo_file(demo_file_path, demo_modified_time)
+        data_key = (demo_file_path, demo_modified_time)
         st.sidebar.info("Displaying demo data. Upload your file above.")
     else:
         st.error("Demo data file (saasquatch_leads_dummy.csv) not found in 'data' folder.")
 
 
 # Only proceed if DataFrame is successfully loaded
-if df_raw is not None:
-    # Process DataFrame using functions from utils.py
-    df_processed = process_leads(df_raw)
-
+if df_processed is not None:
     # --- Add Filters in Sidebar ---
 
     # 1. Filter by Score Range
-    min_score, max_score = int(df_processed['Score'].min()), int(df_processed['Score'].max())
+    min_score, max_score = df_processed.attrs['score_min'], df_processed.attrs['score_max'] # Precomputed in process_leads
     score_range = st.sidebar.slider(
         "Filter by Score:",
         min_value=min_score,
@@ -69,30 +161,32 @@ if df_raw is not None:
     )
 
     # 2. Filter by Industry (Multi-select)
-    all_industries = sorted(df_processed['Industry'].dropna().unique())
+    all_industries = df_processed.attrs['industries'] # Precomputed in process_leads
     selected_industries = st.sidebar.multiselect(
         "Filter by Industry:",
         options=all_industries,
         default=[] # Defaultnya tidak ada yang dipilih (tampilkan semua)
     )
 
-    # 3. Filter by Flags (Text search)
-    # This allows users to search for leads with specific data issues
-    flag_query = st.sidebar.text_input(
-        "Search leads with specific Flag:",
-        placeholder="e.g., Missing Email"
+    # 3. Filter by Flags (Multi-select)
+    # This allows users to find leads with specific data issues
+    selected_flags = st.sidebar.multiselect(
+        "Filter by Flags:",
+        options=list(FLAG_LABELS.values()),
+        default=[] # Defaultnya tidak ada yang dipilih (tampilkan semua)
     )
 
     # --- Apply Filters to DataFrame ---
-    df_filtered = df_processed[
-        (df_processed['Score'] >= score_range[0]) & (df_processed['Score'] <= score_range[1])
-    ]
-
-    if selected_industries: # If user selects industries
-        df_filtered = df_filtered[df_filtered['Industry'].isin(selected_industries)]
+    df_filtered = filter_leads(
+        df_processed,
+        data_key,
+        tuple(score_range),
+        tuple(sorted(selected_industries)), # Sorted for a stable cache key
+        get_flag_mask(selected_flags)
+    )
 
-    if flag_query: # If user types something in flag search
-        df_filtered = df_filtered[df_filtered['Flags'].str.contains(flag_query, case=False, na=False)]
+    # Flags are stored as bitmasks; convert to readable text for display and export
+    df_filtered = df_filtered.assign(Flags=describe_flags(df_filtered['Flags']))
 
     # --- Main Display: Analysis Results ---
     st.header("Analysis Results & Lead Prioritization")
@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
 import re
-from typing import Union, List
+from typing import List, Tuple
 
 # =============================================================================
 # SCORING CONFIGURATION CONSTANTS
@@ -29,315 +29,474 @@ WEIGHT_EMAIL_AVAILABLE = 10         # Has contact email
 WEIGHT_LINKEDIN_AVAILABLE = 10      # Has LinkedIn profile
 
 # Target industries for lead qualification
-TARGET_INDUSTRIES = [
+TARGET_INDUSTRIES = frozenset({
     'saas', 'fintech', 'healthtech', 'cloud computing', 
     'cybersecurity', 'artificial intelligence', 'data analytics'
-]
+})
 
 # Decision maker keywords (case-insensitive matching)
-DECISION_MAKER_KEYWORDS = ['ceo', 'founder', 'cto', 'ciso', 'chief', 'president']
-INFLUENCER_KEYWORDS = ['owner', 'head', 'director', 'vp', 'vice president']
+DECISION_MAKER_KEYWORDS = frozenset({'ceo', 'founder', 'cto', 'ciso', 'chief', 'president'})
+INFLUENCER_KEYWORDS = frozenset({'owner', 'head', 'director', 'vp', 'vice president'})
+
+# Title seniority codes (see classify_titles)
+TITLE_CODE_OTHER = 0
+TITLE_CODE_INFLUENCER = 1
+TITLE_CODE_DECISION_MAKER = 2
+
+# Precompiled keyword unions so each title is scanned once per keyword group
+# (sorted so the pattern is identical across runs regardless of set ordering)
+DECISION_MAKER_PATTERN = re.compile('|'.join(map(re.escape, sorted(DECISION_MAKER_KEYWORDS))), re.IGNORECASE)
+INFLUENCER_PATTERN = re.compile('|'.join(map(re.escape, sorted(INFLUENCER_KEYWORDS))), re.IGNORECASE)
 
 # Revenue thresholds
 REVENUE_HIGH_THRESHOLD = 20_000_000  # $20M
 REVENUE_MID_THRESHOLD = 5_000_000    # $5M
 
+# Revenue suffix multipliers (e.g. "$4.7B", "2.3M", "10MM", "500K")
+REVENUE_MULTIPLIERS = {
+    'B': 1_000_000_000,
+    'MM': 1_000_000,    # Finance shorthand for millions
+    'M': 1_000_000,
+    'K': 1_000,
+    '': 1
+}
+
 # Employee count thresholds
 EMPLOYEES_ENTERPRISE_THRESHOLD = 200
 EMPLOYEES_MID_MARKET_THRESHOLD = 50
 
+# Free-text contact columns stored as Arrow-backed strings
+TEXT_COLUMNS = ['Owner Name', 'Owner Title', 'Owner Email', 'Owner LinkedIn', 'Company LinkedIn']
+
+# Data quality flag bits (combined into the uint8 Flags column)
+FLAG_MISSING_EMAIL = 1 << 0
+FLAG_MISSING_CONTACT_NAME = 1 << 1
+FLAG_MISSING_INDUSTRY = 1 << 2
+FLAG_MISSING_SIZE_REVENUE = 1 << 3
+FLAG_MISSING_COMPANY_LINKEDIN = 1 << 4
+FLAG_MISSING_JOB_TITLE = 1 << 5
+
+# Human-readable flag labels, in display order
+FLAG_LABELS = {
+    FLAG_MISSING_EMAIL: 'Missing Email',
+    FLAG_MISSING_CONTACT_NAME: 'Missing Contact Name',
+    FLAG_MISSING_INDUSTRY: 'Missing Industry',
+    FLAG_MISSING_SIZE_REVENUE: 'Missing Size/Revenue Data',
+    FLAG_MISSING_COMPANY_LINKEDIN: 'Missing Company LinkedIn',
+    FLAG_MISSING_JOB_TITLE: 'Missing Job Title'
+}
+
 
 # =============================================================================
 # DATA NORMALIZATION FUNCTIONS
 # =============================================================================
 
-def normalize_industry(industry: Union[str, float]) -> str:
+def get_column(df: pd.DataFrame, column: str) -> pd.Series:
     """
-    Normalize industry field for consistent matching.
+    Get a column from the DataFrame, tolerating columns absent from the upload.
     
     Args:
-        industry: Raw industry string or NaN
+        df: DataFrame containing lead data
+        column: Column name
         
     Returns:
-        Normalized industry string (lowercase, stripped) or empty string
+        The column, or an all-missing Series aligned to the DataFrame index
     """
-    if pd.isna(industry):
-        return ""
+    if column in df.columns:
+        return df[column]
     
-    return str(industry).lower().strip()
+    return pd.Series(None, index=df.index, dtype=object)
 
 
-def normalize_revenue(revenue: Union[str, int, float]) -> float:
+def has_value(values: pd.Series) -> np.ndarray:
     """
-    Convert revenue string formats to float values.
-    Handles formats like: "$4.7B", "2.3M", "500K", "1000000"
+    Check which entries hold a non-blank value.
     
     Args:
-        revenue: Raw revenue value in various formats
+        values: Raw column values
         
     Returns:
-        Revenue as float, or 0.0 if invalid/missing
+        Boolean array, True where the value is present and not whitespace-only
     """
-    if pd.isna(revenue):
-        return 0.0
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Check each category once, then broadcast through the integer codes
+        return lookup_categories(values, has_value(values.cat.categories.to_series()))
     
-    try:
-        # Convert to string and clean
-        revenue_str = str(revenue).upper().replace('$', '').replace(',', '').strip()
-        
-        # Handle billion notation
-        if 'B' in revenue_str:
-            return float(revenue_str.replace('B', '')) * 1_000_000_000
-        
-        # Handle million notation  
-        elif 'M' in revenue_str:
-            return float(revenue_str.replace('M', '')) * 1_000_000
-            
-        # Handle thousand notation
-        elif 'K' in revenue_str:
-            return float(revenue_str.replace('K', '')) * 1_000
-            
-        # Handle plain numbers
-        else:
-            return float(revenue_str)
-            
-    except (ValueError, TypeError):
-        return 0.0
-
-
-def normalize_employee_count(employees: Union[str, int, float]) -> int:
-    """
-    Normalize employee count field to integer.
+    return values.astype('string[pyarrow]').str.strip().fillna('').ne('').to_numpy(dtype=bool)
+
+
+def as_category(values: pd.Series) -> pd.Series:
+    """
+    Convert a column to categorical, tolerating all-missing columns.
+    
+    An all-blank column read with the pyarrow backend has `null[pyarrow]`
+    dtype, which cannot become categorical directly; casting through
+    Arrow-backed strings first yields a categorical with no categories.
     
     Args:
-        employees: Raw employee count value
+        values: Raw column values
         
     Returns:
-        Employee count as integer, or 0 if invalid/missing
+        Categorical column (unchanged if already categorical)
     """
-    if pd.isna(employees):
-        return 0
-        
-    try:
-        # Handle string formats like "50-100", "100+"
-        employees_str = str(employees).replace('+', '').replace(',', '')
-        
-        # Extract first number from ranges
-        if '-' in employees_str:
-            employees_str = employees_str.split('-')[0]
-            
-        return int(float(employees_str))
-        
-    except (ValueError, TypeError):
-        return 0
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values
+    
+    return values.astype('string[pyarrow]').astype('category')
 
 
-# =============================================================================
-# CORE SCORING FUNCTIONS
-# =============================================================================
-
-def calculate_industry_score(industry: str) -> int:
+def lookup_categories(values: pd.Series, category_values: np.ndarray) -> np.ndarray:
     """
-    Calculate score based on industry fit.
+    Broadcast per-category results to every row of a categorical column.
     
     Args:
-        industry: Normalized industry string
+        values: Categorical column
+        category_values: Boolean result per category, in category order
         
     Returns:
-        Industry fit score
+        Boolean array per row, False where the value is missing
     """
-    if not industry:
-        return 0
+    # Trailing entry catches the missing-value code (-1)
+    return np.append(category_values, False)[values.cat.codes.to_numpy()]
+
+
+def normalize_industry(industry: pd.Series) -> pd.Series:
+    """
+    Normalize industry column for consistent matching.
+    
+    Args:
+        industry: Raw industry values (strings or NaN)
         
-    if industry in TARGET_INDUSTRIES:
-        return WEIGHT_INDUSTRY_MATCH
-    else:
-        return WEIGHT_INDUSTRY_OTHER
+    Returns:
+        Normalized industry strings (lowercase, stripped), empty string if missing
+    """
+    return industry.astype('string[pyarrow]').str.lower().str.strip().fillna('')
 
 
-def calculate_size_score(employee_count: int) -> int:
+def normalize_revenue(revenue: pd.Series) -> np.ndarray:
     """
-    Calculate score based on company size (employee count).
+    Convert revenue column formats to float values.
+    Handles formats like: "$4.7B", "2.3M", "10MM", "500K", "1000000"
     
     Args:
-        employee_count: Number of employees
+        revenue: Raw revenue values in various formats
         
     Returns:
-        Company size score
-    """
-    if employee_count > EMPLOYEES_ENTERPRISE_THRESHOLD:
-        return WEIGHT_SIZE_ENTERPRISE
-    elif employee_count >= EMPLOYEES_MID_MARKET_THRESHOLD:
-        return WEIGHT_SIZE_MID_MARKET
-    elif employee_count > 0:
-        return WEIGHT_SIZE_SMALL_BUSINESS
-    else:
-        return 0
+        Revenue as float per lead, or 0.0 if invalid/missing
+    """
+    # Already numeric columns need no string parsing
+    if pd.api.types.is_numeric_dtype(revenue):
+        return pd.to_numeric(revenue, errors='coerce').fillna(0.0).to_numpy(dtype=float)
+    
+    # Clean currency symbols, separators and whitespace in a single pass
+    # (strip() trims Unicode whitespace; Arrow's regex \s is ASCII-only, hence the explicit \xa0)
+    revenue_str = (
+        revenue.astype('string[pyarrow]')
+        .str.upper()
+        .str.strip()
+        .str.replace(r'[$,\s\xa0]', '', regex=True)
+    )
+    
+    # Split into signed amount (optionally in scientific notation, e.g. "1.5E+07") and B/MM/M/K suffix
+    parts = revenue_str.str.extract(r'^(\+?[0-9.]+(?:E[+-]?[0-9]+)?)(MM|[BMK])?$')
+    amount = pd.to_numeric(parts[0], errors='coerce')
+    multiplier = parts[1].fillna('').map(REVENUE_MULTIPLIERS).fillna(1.0)
+    
+    return (amount * multiplier).fillna(0.0).to_numpy(dtype=float)
 
 
-def calculate_revenue_score(revenue: float) -> int:
+def normalize_employee_count(employees: pd.Series) -> np.ndarray:
     """
-    Calculate score based on company revenue.
+    Normalize employee count column to integers.
+    Handles formats like: "50-100", "100+", "1,200"
     
     Args:
-        revenue: Annual revenue in dollars
+        employees: Raw employee count values
         
     Returns:
-        Revenue-based score
+        Employee count as int32 per lead, or 0 if invalid/missing
     """
-    if revenue > REVENUE_HIGH_THRESHOLD:
-        return WEIGHT_REVENUE_HIGH
-    elif revenue >= REVENUE_MID_THRESHOLD:
-        return WEIGHT_REVENUE_MID
+    # Already numeric columns need no string parsing
+    if pd.api.types.is_numeric_dtype(employees):
+        count = pd.to_numeric(employees, errors='coerce')
     else:
-        return 0
+        # Extract first number (lower bound of ranges like "50-100"), keeping a leading sign
+        first_number = (
+            employees.astype('string[pyarrow]')
+            .str.replace(',', '', regex=False)
+            .str.extract(r'(-?\d+)', expand=False)
+        )
+        count = pd.to_numeric(first_number, errors='coerce')
+    
+    # Negative counts are invalid; cap at the int32 maximum so the cast cannot wrap
+    count = count.fillna(0).clip(lower=0, upper=np.iinfo(np.int32).max)
+    return count.to_numpy(dtype=np.int32)
+
 
+# =============================================================================
+# CORE SCORING FUNCTIONS
+# =============================================================================
 
-def calculate_title_score(title: Union[str, float]) -> int:
+def classify_industries(industry: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Calculate score based on contact's job title/seniority.
+    Match industries against target sectors.
+    
+    Industry has few distinct values, so only the categories are
+    normalized and matched; rows look up their result by category code.
     
     Args:
-        title: Job title string
+        industry: Raw industry values (categorical or strings)
         
     Returns:
-        Title-based score
+        Tuple of boolean arrays: (is target industry, is industry defined)
     """
-    if pd.isna(title):
-        return 0
-        
-    title_lower = str(title).lower()
+    industry = as_category(industry)
+    categories = normalize_industry(industry.cat.categories.to_series())
     
-    # Check for decision maker keywords
-    if any(keyword in title_lower for keyword in DECISION_MAKER_KEYWORDS):
-        return WEIGHT_DECISION_MAKER
+    industry_match = lookup_categories(industry, categories.isin(TARGET_INDUSTRIES).to_numpy(dtype=bool))
+    industry_known = lookup_categories(industry, categories.ne('').to_numpy(dtype=bool))
     
-    # Check for influencer keywords  
-    elif any(keyword in title_lower for keyword in INFLUENCER_KEYWORDS):
-        return WEIGHT_INFLUENCER
-    
-    return 0
+    return industry_match, industry_known
 
 
-def calculate_completeness_score(email: Union[str, float], linkedin: Union[str, float]) -> int:
+def classify_titles(title: pd.Series) -> np.ndarray:
     """
-    Calculate score based on data completeness.
+    Encode contact job titles by seniority.
     
     Args:
-        email: Contact email address
-        linkedin: LinkedIn profile URL
+        title: Job title strings (or NaN)
         
     Returns:
-        Data completeness score
+        int8 title code per lead (TITLE_CODE_DECISION_MAKER,
+        TITLE_CODE_INFLUENCER or TITLE_CODE_OTHER)
+    """
+    # Titles repeat heavily across leads, so classify each distinct title once
+    title_index, unique_titles = pd.factorize(title.astype('string[pyarrow]'))
+    
+    # Decision maker keywords take precedence over influencer keywords
+    unique_codes = np.fromiter(
+        (
+            TITLE_CODE_DECISION_MAKER if DECISION_MAKER_PATTERN.search(unique_title)
+            else TITLE_CODE_INFLUENCER if INFLUENCER_PATTERN.search(unique_title)
+            else TITLE_CODE_OTHER
+            for unique_title in unique_titles
+        ),
+        dtype=np.int8,
+        count=len(unique_titles)
+    )
+    
+    # Trailing entry catches the missing-title sentinel (-1) from factorize
+    title_code = np.append(unique_codes, np.int8(TITLE_CODE_OTHER))[title_index]
+    
+    return title_code
+
+
+# Lead score as a single arithmetic expression over the encoded feature arrays
+# (weights and thresholds are inlined; tiers are written mutually exclusive)
+SCORE_EXPRESSION = (
+    # Industry fit
+    f"industry_match * {WEIGHT_INDUSTRY_MATCH}"
+    f" + (industry_known & ~industry_match) * {WEIGHT_INDUSTRY_OTHER}"
+    # Company size
+    f" + (employee_count > {EMPLOYEES_ENTERPRISE_THRESHOLD}) * {WEIGHT_SIZE_ENTERPRISE}"
+    f" + ((employee_count >= {EMPLOYEES_MID_MARKET_THRESHOLD})"
+    f" & (employee_count <= {EMPLOYEES_ENTERPRISE_THRESHOLD})) * {WEIGHT_SIZE_MID_MARKET}"
+    f" + ((employee_count > 0) & (employee_count < {EMPLOYEES_MID_MARKET_THRESHOLD})) * {WEIGHT_SIZE_SMALL_BUSINESS}"
+    # Revenue
+    f" + (revenue > {REVENUE_HIGH_THRESHOLD}) * {WEIGHT_REVENUE_HIGH}"
+    f" + ((revenue >= {REVENUE_MID_THRESHOLD}) & (revenue <= {REVENUE_HIGH_THRESHOLD})) * {WEIGHT_REVENUE_MID}"
+    # Contact seniority
+    f" + (title_code == {TITLE_CODE_DECISION_MAKER}) * {WEIGHT_DECISION_MAKER}"
+    f" + (title_code == {TITLE_CODE_INFLUENCER}) * {WEIGHT_INFLUENCER}"
+    # Data completeness
+    f" + email_ok * {WEIGHT_EMAIL_AVAILABLE}"
+    f" + linkedin_ok * {WEIGHT_LINKEDIN_AVAILABLE}"
+)
+
+# Highest attainable score (best tier of each category); must fit the int8 Score column
+MAX_SCORE = (
+    max(WEIGHT_INDUSTRY_MATCH, WEIGHT_INDUSTRY_OTHER)
+    + max(WEIGHT_SIZE_ENTERPRISE, WEIGHT_SIZE_MID_MARKET, WEIGHT_SIZE_SMALL_BUSINESS)
+    + max(WEIGHT_REVENUE_HIGH, WEIGHT_REVENUE_MID)
+    + max(WEIGHT_DECISION_MAKER, WEIGHT_INFLUENCER)
+    + WEIGHT_EMAIL_AVAILABLE
+    + WEIGHT_LINKEDIN_AVAILABLE
+)
+if MAX_SCORE > np.iinfo(np.int8).max:
+    raise ValueError(f"Scoring weights sum to {MAX_SCORE}, which overflows the int8 Score column")
+
+
+def score_kernel(
+    employee_count: np.ndarray,
+    revenue: np.ndarray,
+    industry_match: np.ndarray,
+    industry_known: np.ndarray,
+    title_code: np.ndarray,
+    email_ok: np.ndarray,
+    linkedin_ok: np.ndarray
+) -> np.ndarray:
     """
-    score = 0
+    Combine encoded lead features into total lead scores.
     
-    if pd.notna(email) and str(email).strip():
-        score += WEIGHT_EMAIL_AVAILABLE
-        
-    if pd.notna(linkedin) and str(linkedin).strip():
-        score += WEIGHT_LINKEDIN_AVAILABLE
+    Evaluates SCORE_EXPRESSION with pd.eval, which uses NumExpr when it is
+    installed: comparisons and the weighted sum run as one fused,
+    multi-threaded pass without per-factor intermediate arrays.
+    Without NumExpr, pandas falls back to plain NumPy evaluation.
+    
+    Args:
+        employee_count: Normalized employee count per lead
+        revenue: Normalized annual revenue per lead
+        industry_match: True where industry is a target industry
+        industry_known: True where industry is defined
+        title_code: Title seniority code per lead (see classify_titles)
+        email_ok: True where contact email is available
+        linkedin_ok: True where LinkedIn profile is available
         
-    return score
-
-
-def calculate_lead_score(row: pd.Series) -> int:
+    Returns:
+        Total lead score per lead (int8)
     """
-    Calculate comprehensive lead score for a single lead.
+    score = pd.eval(
+        SCORE_EXPRESSION,
+        local_dict={
+            'employee_count': employee_count,
+            'revenue': revenue,
+            'industry_match': industry_match,
+            'industry_known': industry_known,
+            'title_code': title_code,
+            'email_ok': email_ok,
+            'linkedin_ok': linkedin_ok
+        }
+    )
+    
+    # int8 holds MAX_SCORE (checked at import) at an eighth of int64's footprint
+    return np.asarray(score).astype(np.int8)
+
+
+def calculate_lead_score(
+    df: pd.DataFrame, 
+    employee_count: np.ndarray, 
+    revenue: np.ndarray
+) -> pd.Series:
+    """
+    Calculate comprehensive lead score for every lead in the DataFrame.
     
     This function combines multiple scoring factors to produce a single
     lead quality score. Higher scores indicate higher-quality leads.
+    Input fields are encoded column-wise, then combined by score_kernel.
     
     Note: This rule-based approach can be extended with ML model predictions
-    by replacing individual scoring functions with model outputs.
+    by replacing individual scoring factors with model outputs.
     
     Args:
-        row: DataFrame row containing lead data
+        df: DataFrame containing lead data
+        employee_count: Normalized employee count per lead
+        revenue: Normalized annual revenue per lead
         
     Returns:
-        Total lead score (0-100+ range)
+        Total lead score per lead (0-100+ range)
     """
-    try:
-        # Normalize input fields
-        industry = normalize_industry(row.get('Industry'))
-        revenue = normalize_revenue(row.get('Revenue'))
-        employee_count = normalize_employee_count(row.get('Employees Count'))
-        
-        # Calculate component scores
-        industry_score = calculate_industry_score(industry)
-        size_score = calculate_size_score(employee_count)
-        revenue_score = calculate_revenue_score(revenue)
-        title_score = calculate_title_score(row.get('Owner Title'))
-        completeness_score = calculate_completeness_score(
-            row.get('Owner Email'), 
-            row.get('Owner LinkedIn')
-        )
-        
-        # Future ML integration point:
-        # ml_score = predict_lead_quality(row) if MODEL_ENABLED else 0
-        
-        total_score = (
-            industry_score + 
-            size_score + 
-            revenue_score + 
-            title_score + 
-            completeness_score
-        )
-        
-        return int(total_score)
-        
-    except Exception as e:
-        # Log error in production system
-        print(f"Warning: Error calculating score for lead: {e}")
-        return 0
+    # Encode input fields as flat arrays
+    industry_match, industry_known = classify_industries(get_column(df, 'Industry'))
+    title_code = classify_titles(get_column(df, 'Owner Title'))
+    email_ok = has_value(get_column(df, 'Owner Email'))
+    linkedin_ok = has_value(get_column(df, 'Owner LinkedIn'))
+    
+    # Future ML integration point:
+    # ml_score = predict_lead_quality(df) if MODEL_ENABLED else 0
+    
+    total_score = score_kernel(
+        employee_count, 
+        revenue, 
+        industry_match, 
+        industry_known, 
+        title_code, 
+        email_ok, 
+        linkedin_ok
+    )
+    
+    return pd.Series(total_score, index=df.index)
 
 
 # =============================================================================
 # DATA QUALITY FLAGS
 # =============================================================================
 
-def generate_quality_flags(row: pd.Series) -> str:
+# Comma-separated flag text for every possible bitmask value
+FLAG_TEXT_LOOKUP = np.array(
+    [
+        ', '.join(label for bit, label in FLAG_LABELS.items() if flags & bit)
+        for flags in range(1 << len(FLAG_LABELS))
+    ],
+    dtype=object
+)
+
+
+def generate_quality_flags(
+    df: pd.DataFrame, 
+    employee_count: np.ndarray, 
+    revenue: np.ndarray
+) -> pd.Series:
     """
-    Generate data quality flags for lead record.
+    Generate data quality flags for every lead record.
     
     Identifies missing or problematic data fields that could impact
     lead qualification or outreach effectiveness.
     
     Args:
-        row: DataFrame row containing lead data
+        df: DataFrame containing lead data
+        employee_count: Normalized employee count per lead
+        revenue: Normalized annual revenue per lead
         
     Returns:
-        Comma-separated string of quality flags, or empty string
+        uint8 bitmask of FLAG_* bits per lead (0 when no issues)
     """
-    flags = []
-    
-    # Critical contact information
-    if pd.isna(row.get('Owner Email')) or not str(row.get('Owner Email', '')).strip():
-        flags.append('Missing Email')
-        
-    if pd.isna(row.get('Owner Name')) or not str(row.get('Owner Name', '')).strip():
-        flags.append('Missing Contact Name')
-    
-    # Company qualification data
-    if pd.isna(row.get('Industry')) or not str(row.get('Industry', '')).strip():
-        flags.append('Missing Industry')
-        
     # Size/revenue indicators (need at least one)
-    has_employee_data = pd.notna(row.get('Employees Count')) and row.get('Employees Count', 0) > 0
-    has_revenue_data = pd.notna(row.get('Revenue')) and normalize_revenue(row.get('Revenue')) > 0
+    has_size_data = (employee_count > 0) | (revenue > 0)
+    
+    flag_checks = [
+        # Critical contact information
+        (FLAG_MISSING_EMAIL, ~has_value(get_column(df, 'Owner Email'))),
+        (FLAG_MISSING_CONTACT_NAME, ~has_value(get_column(df, 'Owner Name'))),
+        # Company qualification data
+        (FLAG_MISSING_INDUSTRY, ~has_value(get_column(df, 'Industry'))),
+        (FLAG_MISSING_SIZE_REVENUE, ~has_size_data),
+        # LinkedIn for social selling
+        (FLAG_MISSING_COMPANY_LINKEDIN, ~has_value(get_column(df, 'Company LinkedIn'))),
+        # Job title for personalization
+        (FLAG_MISSING_JOB_TITLE, ~has_value(get_column(df, 'Owner Title')))
+    ]
+    
+    flags = np.zeros(len(df), dtype=np.uint8)
+    for bit, is_flagged in flag_checks:
+        np.bitwise_or(flags, bit, out=flags, where=is_flagged)
     
-    if not has_employee_data and not has_revenue_data:
-        flags.append('Missing Size/Revenue Data')
+    return pd.Series(flags, index=df.index)
+
+
+def describe_flags(flags: pd.Series) -> pd.Series:
+    """
+    Convert flag bitmasks to human-readable text for display/export.
     
-    # LinkedIn for social selling
-    if pd.isna(row.get('Company LinkedIn')) or not str(row.get('Company LinkedIn', '')).strip():
-        flags.append('Missing Company LinkedIn')
+    Args:
+        flags: uint8 flag bitmasks
         
-    # Job title for personalization
-    if pd.isna(row.get('Owner Title')) or not str(row.get('Owner Title', '')).strip():
-        flags.append('Missing Job Title')
+    Returns:
+        Comma-separated quality flags per lead, or empty string
+    """
+    return pd.Series(FLAG_TEXT_LOOKUP[flags.to_numpy()], index=flags.index)
+
+
+def get_flag_mask(labels: List[str]) -> int:
+    """
+    Combine flag labels into a single bitmask for filtering.
     
-    return ', '.join(flags)
+    Args:
+        labels: Flag labels (values of FLAG_LABELS)
+        
+    Returns:
+        Bitmask with the bit of every given label set
+    """
+    return sum(bit for bit, label in FLAG_LABELS.items() if label in labels)
 
 
 # =============================================================================
@@ -355,23 +514,39 @@ def process_leads(df: pd.DataFrame) -> pd.DataFrame:
         df: Raw DataFrame from CSV file
         
     Returns:
-        Processed DataFrame with Score and Flags columns, sorted by priority
+        Processed DataFrame with Score and Flags columns, sorted by priority.
+        `attrs` holds 'score_min', 'score_max' and sorted 'industries'.
     """
     if df.empty:
         return df
     
-    # Create working copy to avoid modification warnings
-    processed_df = df.copy()
+    # Collect columns by reference rather than copying the whole frame;
+    # converted columns are swapped in, the caller's DataFrame is left untouched
+    columns = dict(df.items())
+    
+    # Contact text columns: Arrow-backed strings for vectorized string kernels
+    for column in TEXT_COLUMNS:
+        if column in columns:
+            columns[column] = columns[column].astype('string[pyarrow]')
+    
+    # Industry is low-cardinality: store as categorical for scoring and filtering
+    if 'Industry' in columns:
+        columns['Industry'] = as_category(columns['Industry'])
+    
+    # copy=False also skips block consolidation, so no column data is copied
+    lead_df = pd.DataFrame(columns, copy=False)
+    
+    # Normalize numeric fields once, shared by scoring and flagging
+    employee_count = normalize_employee_count(get_column(lead_df, 'Employees Count'))
+    revenue = normalize_revenue(get_column(lead_df, 'Revenue'))
     
     # Apply scoring and flagging
-    processed_df['Score'] = processed_df.apply(calculate_lead_score, axis=1)
-    processed_df['Flags'] = processed_df.apply(generate_quality_flags, axis=1)
+    columns['Score'] = calculate_lead_score(lead_df, employee_count, revenue)
+    columns['Flags'] = generate_quality_flags(lead_df, employee_count, revenue)
     
-    # Sort by score (highest first) for priority ranking
-    processed_df = processed_df.sort_values(
-        by='Score', 
-        ascending=False
-    ).reset_index(drop=True)
+    # Rank by score (highest first) for priority ranking;
+    # stable argsort on the int8 scores keeps ties in upload order
+    priority_order = np.argsort(-columns['Score'].to_numpy(), kind='stable')
     
     # Reorder columns for better readability
     priority_columns = [
@@ -380,11 +555,28 @@ def process_leads(df: pd.DataFrame) -> pd.DataFrame:
     ]
     
     # Get remaining columns
-    other_columns = [col for col in processed_df.columns if col not in priority_columns]
+    other_columns = [col for col in columns if col not in priority_columns]
     
     # Reorder with priority columns first
     final_column_order = priority_columns + other_columns
-    processed_df = processed_df[[col for col in final_column_order if col in processed_df.columns]]
+    
+    # Build the output with one take per column: ranked rows, ordered columns
+    processed_df = pd.DataFrame(
+        {
+            col: columns[col].array.take(priority_order) 
+            for col in final_column_order if col in columns
+        },
+        copy=False
+    )
+    
+    # Precompute UI summaries once so Streamlit reruns don't rescan columns
+    # (rows are sorted by score, so the extremes are the first and last rows)
+    processed_df.attrs['score_max'] = int(processed_df['Score'].iat[0])
+    processed_df.attrs['score_min'] = int(processed_df['Score'].iat[-1])
+    processed_df.attrs['industries'] = (
+        processed_df['Industry'].cat.categories.tolist()
+        if 'Industry' in processed_df.columns else []
+    )
     
     return processed_df
 
@@ -420,5 +612,5 @@ def get_scoring_summary() -> dict:
             'employees_enterprise': EMPLOYEES_ENTERPRISE_THRESHOLD,
             'employees_mid_market': EMPLOYEES_MID_MARKET_THRESHOLD
         },
-        'target_industries': TARGET_INDUSTRIES
+        'target_industries': sorted(TARGET_INDUSTRIES)
     }
\ No newline at end of file